@@ -0,0 +1,57 @@
+import re
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+
+def build_keyword_matcher(keywords):
+    """Compile `keywords` into a single-pass matcher: text -> matched list.
+
+    Uses a pyahocorasick automaton when the package is installed (O(n) over
+    the text regardless of keyword count); otherwise falls back to one
+    compiled regex alternation, which is still a single scan.
+    """
+    return _build_cached(tuple(kw.lower() for kw in keywords if kw))
+
+
+@lru_cache(maxsize=64)
+def _build_cached(keywords):
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+
+        def match(text):
+            seen = set()
+            matched = []
+            for _, kw in automaton.iter(text.lower()):
+                if kw not in seen:
+                    seen.add(kw)
+                    matched.append(kw)
+            return matched
+
+        return match
+
+    # Longest alternatives first: regex alternation is leftmost-match, so
+    # 'storm' listed before 'storm surge' would shadow the longer keyword
+    # and diverge from the automaton's results
+    pattern = re.compile(
+        '|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)),
+        re.IGNORECASE
+    )
+
+    def match(text):
+        seen = set()
+        matched = []
+        for m in pattern.finditer(text):
+            kw = m.group(0).lower()
+            if kw not in seen:
+                seen.add(kw)
+                matched.append(kw)
+        return matched
+
+    return match
@@ -0,0 +1,30 @@
+import time
+import threading
+
+
+class TokenBucket:
+    """Simple thread-safe token bucket so concurrent API calls stay within a
+    platform's rate limit without serializing everything behind time.sleep.
+
+    Bursts up to `capacity` pass immediately; sustained traffic is paced at
+    `rate_per_minute`.
+    """
+
+    def __init__(self, rate_per_minute=60, capacity=10):
+        self.capacity = capacity
+        self.tokens = capacity
+        self.refill_rate = rate_per_minute / 60.0  # tokens per second
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_rate
+            time.sleep(wait)
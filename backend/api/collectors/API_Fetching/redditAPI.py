@@ -1,109 +1,158 @@
-import time
+import asyncio
 import logging
-import praw
+
+import asyncpraw
+
+from API_Fetching.keywordMatcher import build_keyword_matcher
+from API_Fetching.ttlCache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Short TTL: fresh disaster posts matter, but repeated polling within a few
+# minutes (e.g. test_all_apis followed by collect_all_data) shouldn't re-hit
+# Reddit's rate limit for identical queries.
+_search_cache = TTLCache(maxsize=512, ttl=300)
+
+# Cap on in-flight Reddit requests per collection run
+_MAX_CONCURRENT_REQUESTS = 8
+
+
 class RedditAPI:
+    """Reddit collector built on asyncpraw.
+
+    All subreddit fetches for one collection run are multiplexed on a single
+    event loop (one aiohttp session, no worker threads); the synchronous
+    entry points the collector uses simply drive that loop with asyncio.run.
+    """
+
     def __init__(self, client_id, client_secret, user_agent):
-        try:
-            self.reddit = praw.Reddit(
-                client_id=client_id,
-                client_secret=client_secret,
-                user_agent=user_agent,
-                check_for_async=False
-            )
-            
-            # Test the connection with a simple request
-            test_subreddit = self.reddit.subreddit('test')
-            _ = test_subreddit.display_name
+        self._credentials = {
+            'client_id': client_id,
+            'client_secret': client_secret,
+            'user_agent': user_agent,
+        }
+
+        # Probe the credentials up front, mirroring the old eager praw check
+        self.reddit = self.test_connection()
+        if self.reddit:
             logger.info("Reddit API initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize Reddit API: {e}")
-            logger.error(f"Error details: {str(e)}")
-            self.reddit = None
-    
+        else:
+            logger.error("Failed to initialize Reddit API")
+
+    def _make_reddit(self):
+        return asyncpraw.Reddit(**self._credentials)
+
     def search_disaster_posts(self, keywords, limit=10):
         if not self.reddit:
             logger.warning("Reddit API not available")
             return []
-        
+
+        try:
+            return asyncio.run(self.search_disaster_posts_async(keywords, limit))
+        except Exception as e:
+            logger.error(f"Error searching Reddit posts: {e}")
+            return []
+
+    async def search_disaster_posts_async(self, keywords, limit=10):
         # Focus on more active subreddits with disaster/weather content
         subreddits = [
-            "india", "IndiaSpeaks", "indianews", "mumbai", "chennai", 
+            "india", "IndiaSpeaks", "indianews", "mumbai", "chennai",
             "Kerala", "delhi", "bangalore", "kolkata", "pune",
             "weather", "naturaldisasters", "worldnews", "news"
         ]
-        
-        disaster_posts = []
-        posts_per_subreddit = max(1, limit // len(subreddits))
-        
+
         focused_keywords = ['tsunami', 'cyclone', 'flood', 'storm', 'disaster']
-        
-        for subreddit_name in subreddits:
-            try:
-                subreddit = self.reddit.subreddit(subreddit_name)
-                logger.info(f"Searching in r/{subreddit_name}")
-                
-                for keyword in focused_keywords:
-                    try:
-                        search_results = list(subreddit.search(
-                            keyword, 
-                            limit=posts_per_subreddit,
-                            sort="new",
-                            time_filter="month"
-                        ))
-                        
-                        logger.info(f"Found {len(search_results)} posts for '{keyword}' in r/{subreddit_name}")
-                        
-                        for post in search_results:
-                            try:
-                                post_data = {
-                                    'platform': 'reddit',
-                                    'id': post.id,
-                                    'title': post.title,
-                                    'selftext': post.selftext[:500] if post.selftext else "",
-                                    'url': post.url,
-                                    'score': post.score,
-                                    'created_utc': post.created_utc,
-                                    'subreddit': str(post.subreddit),
-                                    'author': str(post.author) if post.author else "deleted",
-                                    'num_comments': post.num_comments,
-                                    'keyword_matched': keyword,
-                                    'permalink': f"https://reddit.com{post.permalink}"
-                                }
-                                disaster_posts.append(post_data)
-                                
-                            except Exception as e:
-                                logger.error(f"Error processing post {post.id}: {e}")
-                                continue
-                                
-                    except Exception as e:
-                        logger.error(f"Error searching for '{keyword}' in r/{subreddit_name}: {e}")
-                        continue
-                    
-                    time.sleep(0.5)
-                    
-            except Exception as e:
-                logger.error(f"Error accessing subreddit r/{subreddit_name}: {e}")
-                continue
-                
-            time.sleep(1)
-        
+        matcher = build_keyword_matcher(focused_keywords + list(keywords or []))
+
+        # One listing fetch per subreddit, matched against every keyword in a
+        # single pass; the semaphore bounds in-flight requests for Reddit's
+        # rate limit.
+        fetch_limit = max(1, limit // len(subreddits)) * len(focused_keywords)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+        disaster_posts = []
+        async with self._make_reddit() as reddit:
+            tasks = [
+                self._scan_subreddit(reddit, semaphore, sub, fetch_limit, matcher)
+                for sub in subreddits
+            ]
+            for sub, result in zip(subreddits, await asyncio.gather(*tasks, return_exceptions=True)):
+                if isinstance(result, Exception):
+                    logger.error(f"Error scanning r/{sub}: {result}")
+                else:
+                    disaster_posts.extend(result)
+
         logger.info(f"Total Reddit posts collected: {len(disaster_posts)}")
         return disaster_posts
 
+    async def _scan_subreddit(self, reddit, semaphore, subreddit_name, fetch_limit, matcher):
+        """Fetch recent posts from one subreddit and keep keyword matches."""
+        # Cache the raw listing, not the matched records - the matcher
+        # depends on the caller's keywords, so filtered results under a
+        # keyword-blind key would poison later searches within the TTL
+        cache_key = (subreddit_name, 'new', fetch_limit)
+        recent_posts = _search_cache.get(cache_key)
+        if recent_posts is not None:
+            logger.debug(f"Reddit listing cache hit for {cache_key}")
+        else:
+            async with semaphore:
+                subreddit = await reddit.subreddit(subreddit_name)
+                # raw_json=1 makes Reddit return unescaped text so every
+                # field is present in the one listing response - no lazy
+                # per-attribute fetches
+                recent_posts = [
+                    post async for post in subreddit.new(limit=fetch_limit, params={'raw_json': 1})
+                ]
+            _search_cache.set(cache_key, recent_posts)
+
+        posts = []
+        try:
+            posts.extend(self._iter_post_records(recent_posts, matcher, subreddit_name))
+        except Exception as e:
+            logger.error(f"Error processing posts from r/{subreddit_name}: {e}")
+
+        logger.info(f"Found {len(posts)} matching posts in r/{subreddit_name}")
+        return posts
+
+    @staticmethod
+    def _iter_post_records(posts, matcher, subreddit_name):
+        """Yield result dicts for posts that match at least one keyword."""
+        for post in posts:
+            selftext = post.selftext[:500] if post.selftext else ""
+            matched = matcher(post.title + ' ' + selftext)
+            if not matched:
+                continue
+
+            # The subreddit name is already known - avoid str(post.subreddit)
+            # which goes through asyncpraw's descriptor machinery per post
+            author = getattr(post, 'author', None)
+            yield {
+                'platform': 'reddit',
+                'id': post.id,
+                'title': post.title,
+                'selftext': selftext,
+                'url': post.url,
+                'score': post.score,
+                'created_utc': post.created_utc,
+                'subreddit': subreddit_name,
+                'author': author.name if author else "deleted",
+                'num_comments': post.num_comments,
+                'keyword_matched': matched[0],
+                'keywords_matched': matched,
+                'permalink': "https://reddit.com" + post.permalink
+            }
+
     def test_connection(self):
         """Test Reddit API connection"""
-        if not self.reddit:
-            return False
-            
         try:
-            test_sub = self.reddit.subreddit('test')
-            _ = test_sub.display_name
-            logger.info("Reddit API test successful")
-            return True
+            return asyncio.run(self._test_connection_async())
         except Exception as e:
             logger.error(f"Reddit API test failed: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    async def _test_connection_async(self):
+        async with self._make_reddit() as reddit:
+            test_sub = await reddit.subreddit('test')
+            _ = test_sub.display_name
+        logger.info("Reddit API test successful")
+        return True
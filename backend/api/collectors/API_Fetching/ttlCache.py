@@ -0,0 +1,36 @@
+import time
+import threading
+
+
+class TTLCache:
+    """Small thread-safe cache with per-entry expiry and LRU-style eviction.
+
+    Used by the platform API wrappers to avoid re-spending external quota
+    when the same query is issued again within the TTL window.
+    """
+
+    def __init__(self, maxsize=512, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for `key`, or None if missing/expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if len(self._data) >= self.maxsize and key not in self._data:
+                # Evict the stalest entry
+                oldest_key = min(self._data, key=lambda k: self._data[k][0])
+                del self._data[oldest_key]
+            self._data[key] = (time.monotonic(), value)
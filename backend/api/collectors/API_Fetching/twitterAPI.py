@@ -1,17 +1,41 @@
 
 import time
 import logging
+from dataclasses import dataclass
 import tweepy
 
+from API_Fetching.rateLimit import TokenBucket
+
 logger = logging.getLogger(__name__)
 
+# Free-tier query budget is tiny, so the search sticks to the core terms;
+# built once rather than re-joined per request
+SEARCH_QUERY = 'tsunami OR cyclone OR flood'
+
+
+@dataclass(slots=True)
+class TweetRecord:
+    """Per-tweet record; slots keep per-object memory at roughly half of an
+    equivalent dict when thousands of tweets are held in one batch.
+    orjson serializes dataclasses natively, so save_raw_data needs no change."""
+    platform: str
+    id: int
+    text: str
+    created_at: str
+    like_count: int
+    retweet_count: int
+    url: str
+
+
 class TwitterAPI:
     def __init__(self, twitter_api_key):
         self.client = tweepy.Client(bearer_token=twitter_api_key)
-        self.last_request_time = 0
         self.request_count = 0
-        self.RATE_LIMIT_DELAY = 1  
-        self.MAX_REQUESTS_PER_15_MIN = 1  
+        # Free tier budget is roughly 1 request/min sustained; the bucket
+        # lets short bursts through instead of a flat 60 s gap per call
+        self.rate_limiter = TokenBucket(rate_per_minute=1, capacity=3)
+        # Set from the API's rate-limit headers when we get a 429
+        self.blocked_until = 0.0
     
     def fetch_ocean_disaster_tweets(self, keywords, max_results=10):
         try:
@@ -20,12 +44,11 @@ class TwitterAPI:
             
 
             adjusted_max_results = 10
-            
-            query = self.build_query(keywords)
-            logger.info(f"Using Twitter query: {query}")
+
+            logger.info(f"Using Twitter query: {SEARCH_QUERY}")
 
             tweets_response = self.client.search_recent_tweets(
-                query=query,
+                query=SEARCH_QUERY,
                 max_results=adjusted_max_results,
 
                 tweet_fields=['created_at', 'public_metrics'],
@@ -38,8 +61,7 @@ class TwitterAPI:
             return self.process_tweets(tweets_response)
             
         except tweepy.TooManyRequests as e:
-            logger.warning(f"Twitter rate limit exceeded. Waiting 15 minutes...")
-            time.sleep(900)  # Wait 15 minutes
+            self._handle_rate_limit_response(e)
             return []
         except tweepy.Forbidden as e:
             logger.error(f"Twitter API access forbidden - check your API tier: {e}")
@@ -49,38 +71,48 @@ class TwitterAPI:
             return []
     
     def _check_rate_limit(self):
-        """Implement very conservative rate limiting for free tier"""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        
-        min_delay = 60  
-        if elapsed < min_delay:
-            sleep_time = min_delay - elapsed
-            logger.info(f"Free tier rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        """Pace requests with the token bucket, honouring any server-reported
+        rate-limit window from a previous 429."""
+        remaining_block = self.blocked_until - time.time()
+        if remaining_block > 0:
+            logger.info(f"Twitter rate limit window active: sleeping for {remaining_block:.0f}s")
+            time.sleep(remaining_block)
+            self.blocked_until = 0.0
+
+        self.rate_limiter.acquire()
         self.request_count += 1
-    
-    def build_query(self, keywords):
-        main_keywords = ['tsunami', 'cyclone', 'flood']
 
-        return ' OR '.join(main_keywords)
+    def _handle_rate_limit_response(self, error):
+        """Read the reset time the API actually reported instead of assuming
+        a worst-case 15 minute wait."""
+        reset_at = 0.0
+        response = getattr(error, 'response', None)
+        if response is not None:
+            headers = getattr(response, 'headers', {}) or {}
+            try:
+                reset_at = float(headers.get('x-rate-limit-reset', 0))
+            except (TypeError, ValueError):
+                reset_at = 0.0
+
+        # Fall back to the documented 15 minute window if no header came back
+        self.blocked_until = reset_at if reset_at > time.time() else time.time() + 900
+        wait = self.blocked_until - time.time()
+        logger.warning(f"Twitter rate limit exceeded. Next request allowed in {wait:.0f}s")
     
     def process_tweets(self, tweets_response):
-        tweets = []
-
-        for tweet in tweets_response.data:            
-            tweet_data = {
-                'platform': 'twitter',
-                'id': tweet.id,
-                'text': tweet.text,
-                'created_at': tweet.created_at.isoformat() if tweet.created_at else None,
-                'like_count': tweet.public_metrics.get('like_count', 0) if tweet.public_metrics else 0,
-                'retweet_count': tweet.public_metrics.get('retweet_count', 0) if tweet.public_metrics else 0,
-                'url': f'https://twitter.com/user/status/{tweet.id}'
-            }
-            
-            tweets.append(tweet_data)
-        
+        data = tweets_response.data
+        tweets = [None] * len(data)
+
+        for i, tweet in enumerate(data):
+            pm = tweet.public_metrics or {}
+            tweets[i] = TweetRecord(
+                'twitter',
+                tweet.id,
+                tweet.text,
+                tweet.created_at.isoformat() if tweet.created_at else None,
+                pm.get('like_count', 0),
+                pm.get('retweet_count', 0),
+                f'https://twitter.com/user/status/{tweet.id}'
+            )
+
         return tweets
\ No newline at end of file
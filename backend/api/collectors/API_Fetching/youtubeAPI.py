@@ -1,67 +1,146 @@
 import logging
+import threading
 from googleapiclient.discovery import build
 
+from API_Fetching.keywordMatcher import build_keyword_matcher
+from API_Fetching.ttlCache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# Search results go stale quickly; video metadata is near-stable
+_search_cache = TTLCache(maxsize=512, ttl=300)
+_details_cache = TTLCache(maxsize=2048, ttl=3600)
+
+# Share one discovery client (and its underlying HTTP connection pool) per
+# API key across all YoutubeAPI instances.
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _get_youtube_client(youtube_api_key):
+    with _clients_lock:
+        client = _clients.get(youtube_api_key)
+        if client is None:
+            client = build('youtube', 'v3', developerKey=youtube_api_key)
+            _clients[youtube_api_key] = client
+        return client
+
+
 class YoutubeAPI:
     def __init__(self, youtube_api_key):
-        self.youtube = build('youtube', 'v3', developerKey=youtube_api_key)
-        
+        self.youtube = _get_youtube_client(youtube_api_key)
+
     def search_ocean_disaster_videos(self, keywords, region_code='IN', max_results=10):
+        # Accept either a prebuilt query string or an iterable of keywords,
+        # so callers with a fixed keyword set can join once up front
+        if isinstance(keywords, str):
+            query = keywords
+            keyword_list = [kw.strip() for kw in keywords.split(' OR ') if kw.strip()]
+        else:
+            keyword_list = sorted(keywords)
+            query = ' OR '.join(keyword_list)
+        cache_key = (query, max_results, region_code)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"YouTube search cache hit for {cache_key}")
+            return cached
+
         try:
             search_response = self.youtube.search().list(
-                q=' OR '.join(keywords),
+                q=query,
                 part='id,snippet',
                 maxResults=max_results,
                 type='video',
                 regionCode=region_code,
                 relevanceLanguage='en'
             ).execute()
-            
-            return self.process_youtube_videos(search_response)
+
+            videos = self.process_youtube_videos(search_response, keyword_list)
+            _search_cache.set(cache_key, videos)
+            return videos
         except Exception as e:
             logger.error(f"Error searching YouTube videos: {e}")
             return []
     
-    def process_youtube_videos(self, search_response):
-        videos = []
+    def process_youtube_videos(self, search_response, keywords=None):
+        """Fetch details for all search hits in batched videos().list calls.
+
+        The Data API accepts up to 50 comma-separated IDs per request, so N
+        search hits cost ceil(N/50) round-trips instead of N. When `keywords`
+        is given, each record is annotated with the keywords found in its
+        title/description in a single matcher pass, so downstream ranking
+        doesn't re-scan the text.
+        """
+        matcher = build_keyword_matcher(keywords) if keywords else None
+        video_ids = []
         for item in search_response.get('items', []):
             try:
-                video_id = item['id']['videoId']
-                video_details = self.get_video_details(video_id)
-                if video_details:
-                    videos.append(video_details)
+                video_ids.append(item['id']['videoId'])
+            except KeyError:
+                continue
+
+        videos = []
+        for start in range(0, len(video_ids), 50):
+            batch = video_ids[start:start + 50]
+            try:
+                video_response = self.youtube.videos().list(
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(batch),
+                    maxResults=50
+                ).execute()
             except Exception as e:
-                logger.error(f"Error processing YouTube video: {e}")
+                logger.error(f"Error fetching YouTube video batch: {e}")
                 continue
+
+            for item in video_response.get('items', []):
+                try:
+                    details = self._build_video_record(item)
+                    if matcher is not None:
+                        details['keywords_matched'] = matcher(
+                            details['title'] + ' ' + details['description']
+                        )
+                    _details_cache.set(details['id'], details)
+                    videos.append(details)
+                except Exception as e:
+                    logger.error(f"Error processing YouTube video: {e}")
+                    continue
         return videos
-    
+
     def get_video_details(self, video_id):
+        cached = _details_cache.get(video_id)
+        if cached is not None:
+            return cached
+
         try:
             video_response = self.youtube.videos().list(
                 part='snippet,statistics,contentDetails',
                 id=video_id
             ).execute()
-            
+
             if not video_response['items']:
                 return None
-                
-            item = video_response['items'][0]
-            snippet = item['snippet']
-            stats = item['statistics']
-            
-            return {
-                'platform': 'youtube',
-                'id': video_id,
-                'title': snippet['title'],
-                'description': snippet.get('description', ''),
-                'published_at': snippet['publishedAt'],
-                'channel_title': snippet['channelTitle'],
-                'view_count': stats.get('viewCount', 0),
-                'like_count': stats.get('likeCount', 0),
-                'comment_count': stats.get('commentCount', 0),
-                'url': f'https://www.youtube.com/watch?v={video_id}'
-            }
+
+            details = self._build_video_record(video_response['items'][0])
+            _details_cache.set(video_id, details)
+            return details
         except Exception as e:
             logger.error(f"Error getting YouTube video details: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def _build_video_record(self, item):
+        video_id = item['id']
+        snippet = item['snippet']
+        stats = item['statistics']
+
+        return {
+            'platform': 'youtube',
+            'id': video_id,
+            'title': snippet['title'],
+            'description': snippet.get('description', ''),
+            'published_at': snippet['publishedAt'],
+            'channel_title': snippet['channelTitle'],
+            'view_count': stats.get('viewCount', 0),
+            'like_count': stats.get('likeCount', 0),
+            'comment_count': stats.get('commentCount', 0),
+            'url': f'https://www.youtube.com/watch?v={video_id}'
+        }
\ No newline at end of file
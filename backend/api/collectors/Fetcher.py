@@ -1,8 +1,9 @@
 
 import os
-import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import orjson
 from dotenv import load_dotenv
 
 # Import our custom API modules
@@ -47,8 +48,8 @@ class SocialMediaCollector:
         # Initialize Google API only if all credentials are provided
         if all([google_api_key,google_cx]):
             self.web_search_api = WebSearchAPI(google_api_key,google_cx)
-        # Ocean disaster keywords
-        self.keywords = [
+        # Ocean disaster keywords; frozenset so membership checks are O(1)
+        self.keywords = frozenset([
             'tsunami', 'storm surge', 'coastal flooding', 'high waves',
             'cyclone', 'hurricane', 'sea level rise', 'tidal waves',
             'coastal erosion', 'storm tide', 'rogue waves', 'flood',
@@ -56,7 +57,12 @@ class SocialMediaCollector:
             'ocean warning', 'marine alert', 'coastal danger',
             # Proper Hindi keywords (fixed encoding)
             'सुनामी', 'तूफान', 'बाढ़', 'चक्रवात', 'आपदा', 'समुद्री तूफान'
-        ]
+        ])
+        # Ordered view for APIs that slice the keyword list (WebSearchAPI
+        # takes keywords[:3]/[:2]); the query string is the same every run,
+        # so join it once
+        self._keyword_list = sorted(self.keywords)
+        self._joined_query = ' OR '.join(self._keyword_list)
     
     def collect_youtube_data(self, max_results=10):
         """Collect data from YouTube"""
@@ -67,7 +73,7 @@ class SocialMediaCollector:
         try:
             logger.info("Fetching YouTube data...")
             data = self.youtube_api.search_ocean_disaster_videos(
-                self.keywords, max_results=max_results
+                self._joined_query, max_results=max_results
             )
             logger.info(f"Collected {len(data)} YouTube videos")
             return data
@@ -116,11 +122,11 @@ class SocialMediaCollector:
         try:
             logger.info("Fetching Web Search Data...")
             data = self.web_search_api.search_disaster_news(
-                self.keywords,max_results
+                self._keyword_list,max_results
             )
             data = self.web_search_api.search_news_sites(
-                self.keywords,max_results
-            )           
+                self._keyword_list,max_results
+            )
             logger.info(f"Collected {len(data)} Web searches")
             return data
         except Exception as e:
@@ -129,7 +135,13 @@ class SocialMediaCollector:
         
     
     def collect_all_data(self, max_results_per_platform=10):
-        """Collect data from all available platforms"""
+        """Collect data from all available platforms concurrently.
+
+        Each platform fetch is network-bound, so running them in a thread pool
+        brings total wall time down to the slowest platform instead of the sum
+        of all of them. The collect_* methods already swallow their own errors
+        and return [] on failure, so a failed platform never poisons the batch.
+        """
         all_data = {
             'timestamp': datetime.now().isoformat(),
             'twitter_posts': [],
@@ -137,12 +149,21 @@ class SocialMediaCollector:
             'youtube_data': [],
             'web_search_data': []
         }
-        
-        # Collect from each platform
-        all_data['twitter_posts'] = self.collect_twitter_data(max_results_per_platform)
-        all_data['reddit_posts'] = self.collect_reddit_data(max_results_per_platform)
-        all_data['youtube_data'] = self.collect_youtube_data(max_results_per_platform)
-        all_data['web_search_data'] = self.collect_web_search_data(max_results_per_platform)
+
+        # Fan out one task per platform; each updates its own slot
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                'twitter_posts': executor.submit(self.collect_twitter_data, max_results_per_platform),
+                'reddit_posts': executor.submit(self.collect_reddit_data, max_results_per_platform),
+                'youtube_data': executor.submit(self.collect_youtube_data, max_results_per_platform),
+                'web_search_data': executor.submit(self.collect_web_search_data, max_results_per_platform)
+            }
+            for key, future in futures.items():
+                try:
+                    all_data[key] = future.result()
+                except Exception as e:
+                    logger.error(f"Error collecting {key}: {e}")
+                    all_data[key] = []
         return all_data
     
     def collect_specific_platform(self, platform, max_results=10):
@@ -167,9 +188,11 @@ class SocialMediaCollector:
             filename = os.path.join(output_dir,f"FetchedData_{timestamp}.json")
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-            
+            # orjson serializes straight to UTF-8 bytes, far faster than the
+            # stdlib json module for large collection payloads
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+
             logger.info(f"Raw data saved to {filename}")
             return filename
         except Exception as e:
@@ -245,7 +268,7 @@ def main():
     
     # Print sample data
     if data['twitter_posts']:
-        print(f"\nSample Twitter post: {data['twitter_posts'][0]['text'][:100]}...")
+        print(f"\nSample Twitter post: {data['twitter_posts'][0].text[:100]}...")
     if data['reddit_posts']:
         print(f"Sample Reddit post: {data['reddit_posts'][0]['title'][:100]}...")
     if data['youtube_data']:
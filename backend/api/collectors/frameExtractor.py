@@ -0,0 +1,203 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+except Exception:
+    TurboJPEG = None
+
+logger = logging.getLogger(__name__)
+
+
+class FrameExtractor:
+    """Extract sampled frames from downloaded videos as JPEG files.
+
+    Decoding uses cv2.cudacodec when an OpenCV CUDA build is available so the
+    H.264 decode runs on the GPU; otherwise it falls back to the standard
+    cv2.VideoCapture CPU path. Frames are encoded to JPEG bytes in memory via
+    cv2.imencode and written in one buffered call per file, rather than going
+    through cv2.imwrite's internal encode+write.
+    """
+
+    def __init__(self, output_dir="downloads/frames", jpeg_quality=85, encode_workers=None):
+        self.output_dir = output_dir
+        self.jpeg_quality = jpeg_quality
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # cv2.imencode releases the GIL during the libjpeg encode, so encode
+        # threads scale with cores; a smaller pool handles the disk writes.
+        self._enc_pool = ThreadPoolExecutor(max_workers=encode_workers or (os.cpu_count() or 4))
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+
+        # Keep the output directory open once and create frame files relative
+        # to its fd, so the kernel skips re-resolving the directory path on
+        # every write (not supported on all platforms).
+        self._dir_fd = None
+        if os.open in os.supports_dir_fd:
+            try:
+                self._dir_fd = os.open(self.output_dir, os.O_RDONLY)
+            except OSError:
+                self._dir_fd = None
+
+        # Prefer libjpeg-turbo's SIMD encoder when the PyTurboJPEG binding
+        # and native library are installed; cv2.imencode stays the fallback
+        self._turbojpeg = None
+        if TurboJPEG is not None:
+            try:
+                self._turbojpeg = TurboJPEG()
+                logger.info("FrameExtractor using libjpeg-turbo for JPEG encode")
+            except Exception:
+                self._turbojpeg = None
+
+        self._use_cuda = False
+        try:
+            self._use_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except Exception:
+            pass
+        if self._use_cuda:
+            logger.info("FrameExtractor using CUDA-accelerated decode")
+
+    def extract_frames_per_second(self, video_path, frames_per_second=1):
+        """Sample `frames_per_second` frames from each second of video.
+
+        Returns the list of written frame file paths.
+        """
+        if self._use_cuda:
+            try:
+                return self._extract_cuda(video_path, frames_per_second)
+            except Exception as e:
+                logger.warning(f"CUDA decode failed for {video_path}, falling back to CPU: {e}")
+
+        return self._extract_cpu(video_path, frames_per_second)
+
+    def _extract_cpu(self, video_path, frames_per_second):
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            logger.error(f"Cannot open video: {video_path}")
+            return []
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30
+        interval = max(1, int(fps / frames_per_second))
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+        futures = []
+        try:
+            if total_frames > 0:
+                # Seek straight to each sampled frame so dropped frames are
+                # never decoded; compute cost scales with frames kept, not
+                # frames in the file.
+                for frame_index in range(0, total_frames, interval):
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    futures.append(self._submit_frame(video_path, frame_index, frame))
+            else:
+                # Some backends (live streams, broken headers) report no frame
+                # count and cannot seek reliably; decode sequentially.
+                frame_index = 0
+                while True:
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    if frame_index % interval == 0:
+                        futures.append(self._submit_frame(video_path, frame_index, frame))
+                    frame_index += 1
+        finally:
+            cap.release()
+
+        frame_paths = self._drain_futures(futures)
+        logger.info(f"Extracted {len(frame_paths)} frames from {video_path}")
+        return frame_paths
+
+    def _extract_cuda(self, video_path, frames_per_second):
+        reader = cv2.cudacodec.createVideoReader(video_path)
+        fps = self._probe_fps(video_path)
+        interval = max(1, int(fps / frames_per_second))
+
+        futures = []
+        frame_index = 0
+        while True:
+            ret, gpu_frame = reader.nextFrame()
+            if not ret:
+                break
+            if frame_index % interval == 0:
+                # Download only the frames we keep
+                frame = gpu_frame.download()
+                futures.append(self._submit_frame(video_path, frame_index, frame))
+            frame_index += 1
+
+        frame_paths = self._drain_futures(futures)
+        logger.info(f"Extracted {len(frame_paths)} frames from {video_path} (CUDA)")
+        return frame_paths
+
+    @staticmethod
+    def _probe_fps(video_path):
+        """Read the real frame rate for the CUDA path.
+
+        cudacodec doesn't expose the container fps the way VideoCapture
+        does, so probe it with a throwaway capture; a hardcoded default
+        would silently skew the sampling interval on non-30fps input.
+        """
+        cap = cv2.VideoCapture(video_path)
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS)
+        finally:
+            cap.release()
+        return fps or 30
+
+    def _submit_frame(self, video_path, frame_index, frame):
+        """Queue a frame for encode on the encode pool; returns a future
+        resolving to the written file path (or None on failure)."""
+        return self._enc_pool.submit(self._encode_frame, video_path, frame_index, frame)
+
+    def _encode_frame(self, video_path, frame_index, frame):
+        video_name = os.path.splitext(os.path.basename(video_path))[0]
+        frame_filename = os.path.join(self.output_dir, f"{video_name}_frame{frame_index}.jpg")
+        try:
+            if self._turbojpeg is not None:
+                jpeg_bytes = self._turbojpeg.encode(frame, quality=self.jpeg_quality,
+                                                    pixel_format=TJPF_BGR)
+            else:
+                ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+                if not ok:
+                    logger.error(f"JPEG encode failed for frame {frame_index} of {video_path}")
+                    return None
+                jpeg_bytes = encoded.tobytes()
+            # Hand the write to the IO pool so the encode thread is free for
+            # the next frame
+            return self._io_pool.submit(self._write_bytes, frame_filename, jpeg_bytes)
+        except Exception as e:
+            logger.error(f"Error encoding frame {frame_index} of {video_path}: {e}")
+            return None
+
+    def _write_bytes(self, path, data):
+        try:
+            if self._dir_fd is not None:
+                fd = os.open(os.path.basename(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                             0o644, dir_fd=self._dir_fd)
+                try:
+                    os.write(fd, data)
+                finally:
+                    os.close(fd)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(data)
+            return path
+        except Exception as e:
+            logger.error(f"Error writing {path}: {e}")
+            return None
+
+    def _drain_futures(self, futures):
+        """Resolve the encode -> write future chain, keeping frame order."""
+        frame_paths = []
+        for future in futures:
+            write_future = future.result()
+            if write_future is None:
+                continue
+            path = write_future.result()
+            if path:
+                frame_paths.append(path)
+        return frame_paths
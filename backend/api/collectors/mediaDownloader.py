@@ -0,0 +1,100 @@
+import os
+import asyncio
+import logging
+import shutil
+import uuid
+from urllib.parse import urlparse
+
+import aiofiles
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class MediaDownloader:
+    """Download media files (video/image) referenced by collected posts.
+
+    A single pooled requests.Session is shared across downloads so repeated
+    fetches from the same CDN reuse the TCP+TLS connection instead of paying
+    a fresh handshake per file.
+    """
+
+    def __init__(self, download_dir="downloads/media"):
+        self.download_dir = download_dir
+        os.makedirs(self.download_dir, exist_ok=True)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def download(self, url, filename=None):
+        """Download a single URL to disk.
+
+        Copies the response stream straight from urllib3's raw file object
+        into the output file in 1 MiB blocks, so the transfer never round-trips
+        through small Python-level chunks. Returns the local file path, or
+        None on failure.
+        """
+        if not filename:
+            basename = os.path.basename(urlparse(url).path)
+            filename = basename if basename else str(uuid.uuid4())
+        file_path = os.path.join(self.download_dir, filename)
+
+        try:
+            response = self.session.get(url, stream=True, timeout=15)
+            response.raise_for_status()
+
+            # Transparently gunzip/deflate while copying
+            response.raw.decode_content = True
+            with open(file_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+
+            logger.info(f"Downloaded {url} to {file_path}")
+            return file_path
+        except Exception as e:
+            logger.error(f"Error downloading {url}: {e}")
+            return None
+
+    async def download_many(self, urls, concurrency=16):
+        """Download a batch of URLs concurrently with bounded concurrency.
+
+        Wall time for a batch collapses to roughly the slowest single file
+        instead of the sum of all of them. Returns local paths in the same
+        order as `urls` (None for failures).
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=60)
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            tasks = [self._download_one(session, semaphore, url) for url in urls]
+            return await asyncio.gather(*tasks)
+
+    async def _download_one(self, session, semaphore, url):
+        basename = os.path.basename(urlparse(url).path)
+        filename = basename if basename else str(uuid.uuid4())
+        file_path = os.path.join(self.download_dir, filename)
+
+        try:
+            async with semaphore:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    async with aiofiles.open(file_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(65536):
+                            await f.write(chunk)
+
+            logger.info(f"Downloaded {url} to {file_path}")
+            return file_path
+        except Exception as e:
+            logger.error(f"Error downloading {url}: {e}")
+            return None
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bounded so a fast downloader cannot pile up gigabytes of videos ahead of
+# the extractor
+_DOWNLOAD_QUEUE_SIZE = 8
+
+
+async def process_videos(urls, downloader, extractor, frames_per_second=1, concurrency=4):
+    """Download videos and extract frames as an overlapped pipeline.
+
+    Stage A downloads URLs (bounded concurrency) and feeds local paths into a
+    bounded queue; stage B pulls paths and runs frame extraction in worker
+    threads. Network transfer of video N overlaps decode/encode of video N-1,
+    so throughput is limited by the slowest stage rather than their sum.
+
+    Returns {video_path: [frame paths]} for every successfully processed video.
+    """
+    dl_queue = asyncio.Queue(maxsize=_DOWNLOAD_QUEUE_SIZE)
+    results = {}
+
+    async def producer():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url):
+            # The semaphore must wrap the blocking download itself - holding
+            # it only while spawning the task would let every URL download
+            # at once
+            async with semaphore:
+                path = await asyncio.to_thread(downloader.download, url)
+            if path:
+                await dl_queue.put(path)
+
+        async with asyncio.TaskGroup() as tg:
+            for url in urls:
+                tg.create_task(fetch(url))
+        # All downloads done; signal each consumer to stop
+        for _ in range(concurrency):
+            await dl_queue.put(None)
+
+    async def consumer():
+        while True:
+            path = await dl_queue.get()
+            if path is None:
+                break
+            try:
+                frames = await asyncio.to_thread(
+                    extractor.extract_frames_per_second, path, frames_per_second
+                )
+                results[path] = frames
+            except Exception as e:
+                logger.error(f"Error extracting frames from {path}: {e}")
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(producer())
+        for _ in range(concurrency):
+            tg.create_task(consumer())
+
+    logger.info(f"Pipeline processed {len(results)} of {len(urls)} videos")
+    return results
@@ -1,11 +1,26 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
+import anyio.to_thread
+
 import backend.api.services.citizen_reporter as citizen_reporter
 import backend.api.services.nlp_analyzer as nlp_analyzer
+import backend.api.routes.social_media as social_media
+from backend.api.models.database import init_db
+
+# ORJSONResponse serializes straight to bytes, skipping stdlib json and the
+# extra UTF-8 encode on every reply
+app = FastAPI(title="Unified Hazard API", default_response_class=ORJSONResponse)
+
 
-app = FastAPI(title="Unified Hazard API")
+@app.on_event("startup")
+async def on_startup():
+    init_db()
+    # Default anyio pool is 40 tokens; raise it so many simultaneous
+    # threadpool-wrapped searches don't starve incoming connections
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
 
 # Development CORS - open to all origins. Lock this down for production.
 app.add_middleware(
@@ -26,6 +41,7 @@ app.mount(
 # Include routers from modules
 app.include_router(citizen_reporter.router)
 app.include_router(nlp_analyzer.router)
+app.include_router(social_media.router)
 
 
 @app.get("/")
@@ -1,15 +1,37 @@
-from sqlalchemy import create_engine, Column, String, Float, Integer, DateTime, JSON, Text
+from sqlalchemy import create_engine, event, Column, String, Float, Integer, DateTime, JSON, Text, Index
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
-import pytz
+from zoneinfo import ZoneInfo
 from datetime import datetime
 # Database Configuration
 DATABASE_URL = "sqlite:///./backend/data/database/citizen_reporter.db"
+# Default QueuePool: connections are reused across requests but each
+# checked-out Session gets its own - a single shared connection
+# (StaticPool) would make concurrent requests share one transaction,
+# and WAL's concurrent readers need separate connections anyway
 engine = create_engine(
-    DATABASE_URL, 
+    DATABASE_URL,
     connect_args={"check_same_thread": False}  #only for sqlite
 )
-IST = pytz.timezone('Asia/Kolkata')
+
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets readers proceed during writes (the default rollback journal
+    blocks them), and the cache/temp settings keep hot pages and temp
+    structures in memory."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+# stdlib zoneinfo reads the OS tz database and caches the zone internally,
+# so the per-insert datetime.now(IST) lookup is O(1) after first use
+IST = ZoneInfo('Asia/Kolkata')
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -18,11 +40,11 @@ class HazardReport(Base):
     __tablename__ = "hazard_reports"
     id = Column(String, primary_key=True)
     user_id = Column(String, nullable=False)
-    timestamp = Column(DateTime, default= lambda: datetime.now(IST))
+    timestamp = Column(DateTime, default= lambda: datetime.now(IST), index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
     location_name = Column(String)
-    hazard_type = Column(String, nullable=False)
+    hazard_type = Column(String, nullable=False, index=True)
     severity = Column(Integer)  # 1-5 scale
     description = Column(Text)
     media_urls = Column(JSON)
@@ -30,8 +52,18 @@ class HazardReport(Base):
     priority_score = Column(Float)
     nearby_reports = Column(JSON)  # IDs of reports within 5km
     weather_conditions = Column(JSON)
-    
-Base.metadata.create_all(bind=engine)
+
+    # Composite indexes: (hazard_type, timestamp) serves filtered listings,
+    # (latitude, longitude, timestamp) covers the bounding-box + recency
+    # prefilter in find_nearby_reports, and the descending
+    # (timestamp, priority_score) pair matches the recent-first /
+    # highest-priority ordering of the list endpoints
+    __table_args__ = (
+        Index('ix_reports_type_time', 'hazard_type', 'timestamp'),
+        Index('ix_report_geo_time', 'latitude', 'longitude', 'timestamp'),
+        Index('ix_reports_user', 'user_id'),
+        Index('ix_reports_time_prio', timestamp.desc(), priority_score.desc()),
+    )
 
 class AuthorityAlerts(Base):
     __tablename__= "authority_alerts"
@@ -42,6 +74,16 @@ class AuthorityAlerts(Base):
     status =  Column(String,nullable=False)
     timestamp = Column(DateTime, default= lambda: datetime.now(IST))
 
-Base.metadata.create_all(bind=engine)
 
+def init_db():
+    """Create all tables and indexes. Called once at application startup
+    instead of running create_all (a PRAGMA/SELECT round-trip per table)
+    on import."""
+    Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, and the repo ships a
+    # prebuilt citizen_reporter.db - indexes declared after that database
+    # was created must be added explicitly or they silently never exist
+    for table in Base.metadata.tables.values():
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
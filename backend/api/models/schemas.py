@@ -1,6 +1,14 @@
 from pydantic import BaseModel, field_validator
 from typing import Optional ,Dict
 from datetime import datetime
+
+# Module-level frozenset: O(1) membership and no per-validation list build
+# on the report submission hot path
+HAZARD_TYPES = frozenset({
+    'tsunami', 'storm_surge', 'high_waves', 'coastal_flooding',
+    'cyclone', 'rip_current', 'coastal_erosion', 'other'
+})
+
 class ReportSubmission(BaseModel):
     user_id: str
     latitude: float
@@ -25,10 +33,8 @@ class ReportSubmission(BaseModel):
     
     @field_validator('hazard_type')
     def validate_hazard_type(cls, v):
-        valid_types = ['tsunami', 'storm_surge', 'high_waves', 'coastal_flooding', 
-                      'cyclone', 'rip_current', 'coastal_erosion', 'other']
-        if v not in valid_types:
-            raise ValueError(f'Hazard type must be one of {valid_types}')
+        if v not in HAZARD_TYPES:
+            raise ValueError(f'Hazard type must be one of {sorted(HAZARD_TYPES)}')
         return v
     
     @field_validator('severity')
@@ -0,0 +1,63 @@
+import os
+import sys
+import logging
+from pathlib import Path
+
+from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+
+# The collector modules import each other as `API_Fetching.*`, so the
+# collectors directory has to be importable from here
+_COLLECTORS_DIR = str(Path(__file__).resolve().parents[1] / 'collectors')
+if _COLLECTORS_DIR not in sys.path:
+    sys.path.insert(0, _COLLECTORS_DIR)
+
+from API_Fetching.websearchAPI import WebSearchAPI
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Single shared client: one connection pool, one Google validation probe
+_web_api = None
+
+
+def _get_web_api():
+    global _web_api
+    if _web_api is None:
+        _web_api = WebSearchAPI(
+            os.getenv('GOOGLE_CUSTOM_SEARCH_API'),
+            os.getenv('GOOGLE_CUSTOM_SEARCH_ID')
+        )
+    return _web_api
+
+
+@router.get("/api/social-media/search")
+async def search_disaster_news(
+    keywords: str = Query(..., description="Comma-separated search keywords"),
+    max_results: int = 10,
+    time_filter: str = 'week'
+):
+    """Search the web for disaster news.
+
+    WebSearchAPI is built on blocking requests + token-bucket sleeps, so
+    every call runs in Starlette's thread pool - the event loop keeps
+    serving other clients while a search waits on the network.
+    """
+    keyword_list = [k.strip() for k in keywords.split(',') if k.strip()]
+    if not keyword_list:
+        raise HTTPException(status_code=400, detail="No keywords provided")
+
+    web_api = await run_in_threadpool(_get_web_api)
+    results = await run_in_threadpool(
+        web_api.search_disaster_news, keyword_list, max_results, 'auto', time_filter
+    )
+    return {"count": len(results), "results": results}
+
+
+@router.get("/api/social-media/trending")
+async def get_trending_disasters():
+    """Trending disaster news across the monitored keywords."""
+    web_api = await run_in_threadpool(_get_web_api)
+    results = await run_in_threadpool(web_api.get_trending_disasters)
+    return {"count": len(results), "results": results}